@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C implementation of the comment prefix scan of NanoLab files.
+
+`_scan_prefix_lines` in `nanolab_dataframe` is the pure Python equivalent, used
+when this extension is not built.
+"""
+from libc.string cimport memchr
+
+
+cdef inline Py_ssize_t _line_end(const char *data, Py_ssize_t start, Py_ssize_t size):
+    # Index right after the next newline, or the end of the buffer
+    cdef const char *newline = <const char *>memchr(data + start, ord('\n'), size - start)
+    if newline == NULL:
+        return size
+    return newline - data + 1
+
+
+def scan_prefix_buffer(const unsigned char[::1] buffer):
+    """
+    Scans the comment prefix of a file held in a buffer, such as a memory map.
+
+    Returns:
+        Tuple[bytes, List[str], int, int]: The first line of the file, the content of the
+        lines starting with '#\\t', the number of comment lines and the byte offset of the
+        first line after the comments.
+    """
+    cdef Py_ssize_t size = buffer.shape[0]
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t end
+    cdef Py_ssize_t header_count = 0
+    cdef const char *data
+    comment_lines = []
+
+    if size == 0:
+        return b"", comment_lines, 0, 0
+
+    data = <const char *>&buffer[0]
+    end = _line_end(data, 0, size)
+    first_line = data[:end]
+    while start < size and data[start] == ord('#'):
+        end = _line_end(data, start, size)
+        header_count += 1
+        if end - start >= 2 and data[start + 1] == ord('\t'):
+            comment_lines.append(data[start + 2:end].decode('utf-8').strip())
+        start = end
+
+    return first_line, comment_lines, header_count, start
@@ -1,15 +1,23 @@
+import functools
+import io
+import mmap
 import os
 import re
+import threading
 import warnings
 import logging
-from typing import Dict, List, Tuple, Type
+from typing import Dict, FrozenSet, List, Tuple, Type
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from kedro.framework.session import KedroSession
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matches the procedure name enclosed within angle brackets in the first line of a file
+_ANGLE_RE = re.compile(r"<([^>]*)>")
+
 
 def get_data_key(path):
     """
@@ -28,14 +36,11 @@ def get_data_key(path):
         Output:
             '2024-11-29/ITt2024-11-29_1'
     """
-    # Split the path into components based on the operating system's path separator
-    splitted_path = path.split("/")
+    # Extract the folder name (immediate parent of the file)
+    folder = os.path.basename(os.path.dirname(path))
 
     # Extract the file name (without the extension)
-    file_name = splitted_path[-1].split(".")[0]
-
-    # Extract the folder name (immediate parent of the file)
-    folder = splitted_path[-2]
+    file_name = os.path.splitext(os.path.basename(path))[0]
 
     # Join the folder and file name using the OS path separator
     return os.path.join(folder, file_name)
@@ -50,23 +55,43 @@ def load_catalog_item(dataset_name: str) -> Dict:
         catalog = context.catalog
         try:
             dataset = catalog.load(dataset_name)
-            logger.info(f"Loaded dataset: {dataset_name}")
+            logger.info("Loaded dataset: %s", dataset_name)
             return dataset
         except KeyError:
-            logger.error(f"Dataset '{dataset_name}' not found in catalog.")
+            logger.error("Dataset '%s' not found in catalog.", dataset_name)
             raise
 
 
 _cached_procedures = None
+_procedures_lock = threading.Lock()
+
+
+def set_procedures(procedures: Dict) -> None:
+    """
+    Stores the 'procedures' catalog item so that later loads do not need a Kedro session.
+
+    Called by `DynamicDatasetHook` as soon as the catalog is created.
+    """
+    global _cached_procedures
+    _cached_procedures = procedures
+    # Drop anything memoized from previously registered procedures
+    get_keys.cache_clear()
+    _keys_processed_as.cache_clear()
+    _procedure_dict.cache_clear()
 
 
 def get_procedures() -> Dict:
     """
     Lazily load the 'procedures' catalog item.
+
+    Falls back to creating a Kedro session only if the procedures were not
+    registered through `set_procedures`.
     """
     global _cached_procedures
     if _cached_procedures is None:
-        _cached_procedures = load_catalog_item("params:procedures")
+        with _procedures_lock:
+            if _cached_procedures is None:
+                _cached_procedures = load_catalog_item("params:procedures")
     return _cached_procedures
 
 
@@ -74,6 +99,9 @@ def unix_time_to_datetime(unix_time_str: str) -> pd.Timestamp:
     """
     Converts a Unix timestamp string into a pandas datetime object.
 
+    Datetime properties are no longer parsed with this function and are kept as float
+    seconds, see `_parse_unix_time`. It is kept for external callers.
+
     Args:
         unix_time_str (str): Unix timestamp as a string (e.g., "1731364225.4285064").
 
@@ -120,39 +148,34 @@ def make_dict_from_parsed_data(list_of_lines: List[str]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary with all parsed key-value pairs.
     """
-    # Separate the 'Information' line from the rest
-    info_line = next((line for line in list_of_lines if line.startswith("Information")), None)
-    rest_of_lines = [line for line in list_of_lines if not line.startswith("Information")]
-
-    # Parse the 'Information' line if it exists
-    dict_of_info = parse_info_line(info_line) if info_line else {}
-
-    # Parse remaining lines, skipping any that don't contain a valid separator
+    dict_of_info = None
     dict_rest_of_lines = {}
-    for line in rest_of_lines:
-        if ": " in line:
-            key, value = line.split(": ", 1)
+    for line in list_of_lines:
+        if line.startswith("Information"):
+            # Only the first 'Information' line is parsed
+            if dict_of_info is None:
+                dict_of_info = parse_info_line(line)
+            continue
+
+        # Skip any line that doesn't contain a valid separator
+        key, separator, value = line.partition(": ")
+        if separator:
             dict_rest_of_lines[key.strip()] = value.strip()
 
     # Combine both dictionaries
-    return {**dict_of_info, **dict_rest_of_lines}
+    return {**(dict_of_info or {}), **dict_rest_of_lines}
 
 
 def read_comment_lines(file_path: str) -> Tuple[Dict[str, str], int]:
     """
     Reads and processes comment lines from the beginning of a file.
+
+    Only the contiguous block of '#' lines is read, see `scan_prefix`.
     """
-    comment_lines = []
-    current_line = 0
     try:
-        with open(file_path, 'r') as file:
-            for line in file:
-                if line.strip().startswith('#'):
-                    current_line += 1
-                if line.strip().startswith('#\t'):
-                    comment_lines.append(line.strip().replace("#\t", ""))
+        _, comment_lines, current_line, _ = scan_prefix(file_path)
     except FileNotFoundError:
-        raise FileNotFoundError(f"The file '{file_path}' was not found.")
+        raise
     except Exception as e:
         raise Exception(f"An error occurred while processing the file: {e}")
 
@@ -162,18 +185,76 @@ def read_comment_lines(file_path: str) -> Tuple[Dict[str, str], int]:
         return {}, 0
 
 
+def scan_prefix(file_path: str) -> Tuple[bytes, List[str], int, int]:
+    """
+    Scans the comment prefix at the beginning of a file in a single pass.
+
+    The file is read in binary mode and the scan stops at the first line not starting
+    with '#', so the data block is never touched.
+
+    Args:
+        file_path (str): The path to the file to scan.
+
+    Returns:
+        Tuple[bytes, List[str], int, int]: The first line of the file, the content of the
+        lines starting with '#\\t', the number of comment lines and the byte offset of the
+        first line after the comments.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return _scan_prefix_lines(file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file '{file_path}' was not found.")
+
+
+def _scan_prefix_lines(file) -> Tuple[bytes, List[str], int, int]:
+    """
+    Scans the comment prefix of a binary file object or memory map positioned at its start.
+    """
+    comment_lines = []
+    header_count = 0
+    first_line = line = file.readline()
+    byte_offset = 0
+    while line.startswith(b'#'):
+        header_count += 1
+        if line.startswith(b'#\t'):
+            comment_lines.append(line[2:].decode().strip())
+        byte_offset = file.tell()
+        line = file.readline()
+
+    return first_line, comment_lines, header_count, byte_offset
+
+
+# Use the C implementation of the prefix scan when the extension is built
+try:
+    from nanolab_processing_base.extras._prefix import scan_prefix_buffer as _scan_mapped_prefix
+except ImportError:
+    _scan_mapped_prefix = _scan_prefix_lines
+
+
+def _check_csv(path: str) -> None:
+    if not path.endswith(".csv"):
+        raise ValueError(f"The file '{path}' is not a CSV. Please provide a valid .csv file.")
+
+
 def determine_procedure(path: str) -> str:
     """
     Extracts and processes content enclosed within angle brackets ("<" and ">")
     from the first line of a CSV file corresponding to an experiment.
     """
-    if not path.endswith(".csv"):
-        raise ValueError(f"The file '{path}' is not a CSV. Please provide a valid .csv file.")
+    _check_csv(path)
 
     with open(path, "r") as file:
-        first_line = file.readline().strip()
+        first_line = file.readline()
 
-    match = re.search(r"<(.*?)>", first_line)
+    return _determine_procedure_from_line(first_line)
+
+
+def _determine_procedure_from_line(first_line: str) -> str:
+    """
+    Extracts the procedure name from the first line of an experiment file.
+    """
+    match = _ANGLE_RE.search(first_line.strip())
     if match:
         content = match.group(1)
         return content.split(".")[-1]
@@ -182,33 +263,55 @@ def determine_procedure(path: str) -> str:
         return ""
 
 
+def _parse_unix_time(unix_time_str: str) -> float:
+    # Kept as seconds; datetime columns are converted at once by `consolidate_props`
+    try:
+        return float(unix_time_str)
+    except ValueError as e:
+        raise ValueError(f"Invalid Unix timestamp: {unix_time_str}") from e
+
+
 def string_to_bool(string_bool: str) -> bool:
     return string_bool == "True"
 
 
+def _parse_float(value: str) -> float:
+    # Values with units look like "0.1 V"; only the number is kept
+    return float(value.split(" ", 1)[0])
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+# Parser used for each 'how_to_process' value of the procedures
+_PARSERS = {
+    "float": _parse_float,
+    "int": int,
+    "bool": string_to_bool,
+    "str": _identity,
+    "categorical": _identity,
+    "datetime": _parse_unix_time,
+    "float_no_unit": float,
+}
+
+
 def parse_metadata(key, value, how_to_process):
     """
     Parses a metadata value based on the specified processing type.
     """
-    if how_to_process == "float":
-        return float(value.split(" ")[0])
-    if how_to_process == "int":
-        return int(value)
-    if how_to_process == "bool":
-        return string_to_bool(value)
-    if how_to_process == "str":
-        return value
-    if how_to_process == "datetime":
-        return unix_time_to_datetime(value)
-    if how_to_process == "float_no_unit":
-        return float(value)
-
-    raise ValueError(f"Unhandled metadata key: {key}")
+    parser = _PARSERS.get(how_to_process)
+    if parser is None:
+        raise ValueError(f"Unhandled metadata key: {key}")
+    return parser(value)
 
 
-def get_keys(procedure: str) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def get_keys(procedure: str) -> FrozenSet[str]:
     """
-    Retrieves a list of keys associated with a specific procedure.
+    Retrieves the set of keys associated with a specific procedure.
+
+    The result is memoized per procedure name until `set_procedures` is called again.
     """
     procedures = get_procedures()
     if procedure not in procedures:
@@ -220,19 +323,104 @@ def get_keys(procedure: str) -> List[str]:
     if not isinstance(parameters, list) or not isinstance(metadata, list):
         raise TypeError(f"Expected 'Parameters' and 'Metadata' to be lists in procedure '{procedure}'.")
 
-    return parameters + metadata
+    return frozenset(parameters + metadata)
 
 
-def make_props_data(path: str) -> Tuple[pd.Series, pd.DataFrame]:
+@functools.lru_cache(maxsize=None)
+def _procedure_dict(procedure: str) -> Dict[str, str]:
     """
-    Parses properties and reads data from a file based on the procedure definition.
+    Merges the 'Parameters' and 'Metadata' of a procedure, memoized per procedure name.
     """
-    dictionary_found_properties, header = read_comment_lines(path)
-
-    procedure = determine_procedure(path)
     procedures = get_procedures()
+    return procedures[procedure]["Parameters"] | procedures[procedure]["Metadata"]
+
+
+@functools.lru_cache(maxsize=None)
+def _keys_processed_as(procedure: str, how_to_process: str) -> FrozenSet[str]:
+    """
+    Retrieves the keys of a procedure with the given processing type, memoized.
+    """
+    return frozenset(key for key, how in _procedure_dict(procedure).items() if how == how_to_process)
+
+
+def get_datetime_keys(procedure: str) -> FrozenSet[str]:
+    """
+    Retrieves the keys of a procedure processed as 'datetime'.
+
+    Those properties are returned by `make_props_data` as Unix timestamps in seconds.
+    """
+    return _keys_processed_as(procedure, "datetime")
+
+
+def get_categorical_keys(procedure: str) -> FrozenSet[str]:
+    """
+    Retrieves the keys of a procedure processed as 'categorical'.
+
+    Those properties are returned by `make_props_data` as strings.
+    """
+    return _keys_processed_as(procedure, "categorical")
+
+
+def _to_arrow(dtype) -> pa.DataType:
+    """
+    Translates a dtype from the procedures 'Data' mapping into its Arrow equivalent.
+    """
+    if dtype in ("str", "object", str):
+        return pa.string()
+    return pa.from_numpy_dtype(np.dtype(dtype))
+
+
+def _memory_map(file) -> mmap.mmap:
+    """
+    Maps a file opened in binary mode read-only into memory.
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        raise ValueError(f"The file '{file.name}' is empty.")
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _read_data(mapped: mmap.mmap, byte_offset: int, dtype_mapping: Dict[str, str], path: str) -> pd.DataFrame:
+    """
+    Reads the data block of a memory-mapped file, starting at `byte_offset`.
+
+    Only the procedure columns present in the file are parsed, in the order they appear
+    in its header. The pandas parser is used as a fallback for files Arrow cannot handle.
+    """
+    # A single copy of the data block is shared by both parsers. Arrow is not given a view
+    # of the map itself, as it may release it only after the map has to be closed.
+    body = mapped[byte_offset:]
+    header = body.split(b'\n', 1)[0].rstrip(b'\r').decode()
+    columns = [col for col in (name.strip('"') for name in header.split(',')) if col in dtype_mapping]
+
+    read_options = pa_csv.ReadOptions(block_size=1 << 20)
+    convert_options = pa_csv.ConvertOptions(
+        column_types={col: _to_arrow(dtype_mapping[col]) for col in columns},
+        include_columns=columns,
+    )
+    # Arrow reads every column when `include_columns` is empty
+    if columns:
+        try:
+            table = pa_csv.read_csv(pa.BufferReader(body), read_options=read_options, convert_options=convert_options)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except (pa.ArrowInvalid, pa.ArrowKeyError):
+            pass
+
+    try:
+        return pd.read_csv(io.BytesIO(body), dtype=dtype_mapping, usecols=columns, engine='c')
+    except ValueError as e:
+        raise ValueError(f"Error in reading {path} with dtype mapping: {dtype_mapping}") from e
+
+
+def _parse_props(path: str, first_line: bytes, comment_lines: List[str]) -> Tuple[Dict, str]:
+    """
+    Parses the properties found in the comment prefix of a file and returns them with
+    the name of the file's procedure.
+    """
+    dictionary_found_properties = make_dict_from_parsed_data(comment_lines) if comment_lines else {}
+
+    procedure = _determine_procedure_from_line(first_line.decode('ascii', 'replace'))
     keys = get_keys(procedure)
-    procedure_dict = procedures[procedure]["Parameters"] | procedures[procedure]["Metadata"]
+    procedure_dict = _procedure_dict(procedure)
     props_dict = {}
 
     for key in dictionary_found_properties:
@@ -243,14 +431,39 @@ def make_props_data(path: str) -> Tuple[pd.Series, pd.DataFrame]:
 
     props_dict["data_key"] = get_data_key(path)
     props_dict["Procedure type"] = procedure
-    props_series = pd.Series(props_dict)
+    return props_dict, procedure
 
-    dtype_mapping = procedures[procedure]["Data"]
-    try:
-        data = pd.read_csv(path, header=header, dtype=dtype_mapping)
-    except ValueError as e:
-        raise ValueError(f"Error in reading {path} with dtype mapping: {dtype_mapping}") from e
 
-    return props_series, data
+def make_props(path: str) -> Dict:
+    """
+    Parses the properties of a file based on the procedure definition, without reading
+    its data block.
+    """
+    _check_csv(path)
+
+    with open(path, 'rb') as file, _memory_map(file) as mapped:
+        first_line, comment_lines, _, _ = _scan_mapped_prefix(mapped)
+
+    props_dict, _ = _parse_props(path, first_line, comment_lines)
+    return props_dict
+
+
+def make_props_data(path: str) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Parses properties and reads data from a file based on the procedure definition.
+
+    The file is memory-mapped once: the comment prefix is scanned from the map and the
+    data block is handed to the CSV parser as raw bytes, without decoding it to Python
+    strings.
+
+    Properties processed as 'datetime' are kept as Unix timestamps (float seconds), see
+    `get_datetime_keys`.
+    """
+    _check_csv(path)
 
+    with open(path, 'rb') as file, _memory_map(file) as mapped:
+        first_line, comment_lines, _, byte_offset = _scan_mapped_prefix(mapped)
+        props_dict, procedure = _parse_props(path, first_line, comment_lines)
+        data = _read_data(mapped, byte_offset, get_procedures()[procedure]["Data"], path)
 
+    return props_dict, data
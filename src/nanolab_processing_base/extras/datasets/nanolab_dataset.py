@@ -16,20 +16,19 @@ class NanoLabDataSet(AbstractDataset):
         super().__init__()
         self.filepath = filepath
         self.catalog = catalog
-        self.props = None
-        self.data = None
 
     def _load(self) -> Any:
         """
         Load the dataset by parsing the file and loading properties and data.
 
         Returns:
-            tuple: A tuple of (properties, data), where properties is a pandas Series
-            and data is a pandas DataFrame.
+            tuple: A tuple of (properties, data), where properties is a dictionary
+            and data is a pandas DataFrame. Datetime properties, such as 'Start time',
+            are given as float Unix seconds.
         """
         procedures = get_procedures()  # Ensure procedures are loaded
-        self.props, self.data = make_props_data(self.filepath)
-        return self.props, self.data
+        # Not kept on the instance: the callables of a PartitionedDataset outlive the load
+        return make_props_data(self.filepath)
 
     def _save(self, data: Any) -> None:
         """
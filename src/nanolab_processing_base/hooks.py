@@ -1,73 +1,54 @@
 from kedro.framework.hooks import hook_impl
-from kedro.io import DataCatalog
-from kedro_datasets.pandas import CSVDataset
+from kedro.io import DataCatalog, MemoryDataset
+from kedro_datasets.pandas import ParquetDataset
 from kedro_datasets.partitions import PartitionedDataset
-from nanolab_processing_base.hooks_utils import separate_nanolab_dataset
-
-import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from nanolab_processing_base.extras.datasets.nanolab_dataframe import set_procedures
 
 
 class DynamicDatasetHook:
     def __init__(self):
         self.projects = None
-        self.is_processing = False  # Flag to prevent recursion
+        self.config_loader = None
+
+    @hook_impl
+    def after_context_created(self, context) -> None:
+        """
+        Keep the context's configuration for the 'base_processing' pipeline, so its
+        nodes follow the same environment and configuration source as the catalog.
+        """
+        self.config_loader = context.config_loader
 
     @hook_impl
     def after_catalog_created(self, catalog: DataCatalog, **kwargs) -> None:
         """
-        Register dynamic datasets without triggering infinite recursion.
+        Register the output datasets of every project.
+
+        The projects themselves are processed by the 'base_processing' pipeline.
         """
+        # Share the procedures with every NanoLabDataSet load instead of creating a session per file
+        set_procedures(catalog.load("params:procedures"))
+
         self.projects = [key for key in catalog.list() if key.startswith("project_")]
 
         for project in self.projects:
             # Define paths for the datasets
-            properties_path = f"data/03_primary/properties_{project}.csv"
+            properties_path = f"data/03_primary/properties_{project}.parquet"
             data_path = f"data/03_primary/data_{project}"
 
             # Register dynamic datasets
             catalog.add(
                 f"properties_{project}",
-                CSVDataset(filepath=properties_path),
+                ParquetDataset(filepath=properties_path),
             )
 
+            # The node appends to the same list of properties on every batch
+            catalog.add(f"props_list_{project}", MemoryDataset(copy_mode="assign"))
+
             catalog.add(
                 f"data_{project}",
                 PartitionedDataset(
                     path=data_path,
-                    dataset=CSVDataset,
-                    filename_suffix=".csv",
+                    dataset=ParquetDataset,
+                    filename_suffix=".parquet",
                 ),
             )
-
-        if self.is_processing:  # Prevent recursive calls
-            logger.info("Already processing datasets. Skipping this execution.")
-            return
-
-        self.is_processing = True  # Set flag to avoid recursion
-
-        try:
-            for project in self.projects:
-                # Define paths for the datasets
-                properties_path = f"data/03_primary/properties_{project}.csv"
-                data_path = f"data/03_primary/data_{project}"
-
-                logger.info(f"Processing dataset: {project}")
-                dataset = catalog.load(project)  # This might trigger catalog hooks
-                consolidated_props, indexed_data = separate_nanolab_dataset(dataset)
-
-                # Save properties
-                catalog.save(f"properties_{project}", consolidated_props)
-                logger.info(f"Saved properties for {project} to {properties_path}")
-
-                # Save partitioned dataset
-                catalog.save(f"data_{project}", indexed_data)
-                logger.info(f"Saved data partitions for {project} to {data_path}")
-        except Exception as e:
-            logger.error(f"Error processing datasets: {e}")
-        finally:
-            self.is_processing = False
-
@@ -1,30 +1,108 @@
-from typing import Dict, Callable, Tuple
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Callable, Iterator, List, Optional, Tuple
 import pandas as pd
 import logging
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from nanolab_processing_base.extras.datasets.nanolab_dataframe import (
+    get_categorical_keys,
+    get_datetime_keys,
+)
 logger = logging.getLogger(__name__)
-def separate_nanolab_dataset(experiments: Dict[str, Callable]) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+def _window(max_workers: Optional[int]) -> int:
+    # Number of experiments parsed ahead of the consumer
+    return 2 * (max_workers or os.cpu_count() or 1)
+
+
+def iter_nanolab_dataset(
+    experiments: Dict[str, Callable], max_workers: Optional[int] = None
+) -> Iterator[Tuple[str, Dict, pd.DataFrame]]:
     """
-    Separates a NanoLab dataset into a consolidated properties DataFrame and indexed data.
+    Parses the experiments of a NanoLab dataset and yields (key, properties, data) in order.
+
+    Experiments are parsed concurrently in a thread pool of ``max_workers`` threads; the
+    CSV parsing releases the GIL. Only a couple of experiments per thread are parsed ahead
+    of the consumer, so memory stays bounded when each partition is saved as it is yielded.
+    Experiments that fail to parse are logged and skipped.
     """
-    logger.info(f"Starting separation of NanoLab dataset with {len(experiments)} experiments.")
-    props_list = []
-    indexed_data = {}
-    for key, experiment_callable in experiments.items():
-        try:
-            prop, data = experiment_callable()
-            props_list.append(prop)
-            indexed_data[key] = data
-            logger.info(f"Processed experiment: {key}")
-        except Exception as e:
-            logger.error(f"Error processing experiment {key}: {e}")
-
-    consolidated_props = pd.DataFrame(props_list)
+    window = _window(max_workers)
+    remaining = iter(experiments.items())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            (key, executor.submit(experiment_callable))
+            for key, experiment_callable in islice(remaining, window)
+        )
+        while pending:
+            key, future = pending.popleft()
+            for next_key, experiment_callable in islice(remaining, 1):
+                pending.append((next_key, executor.submit(experiment_callable)))
+            try:
+                prop, data = future.result()
+            except Exception as e:
+                logger.error("Error processing experiment %s: %s", key, e)
+                continue
+            logger.info("Processed experiment: %s", key)
+            yield key, prop, data
+
+
+def consolidate_props(props_list: List[Dict]) -> pd.DataFrame:
+    """
+    Builds the properties DataFrame of a NanoLab dataset, sorted by start time.
+    """
+    if not props_list:
+        return pd.DataFrame()
+
+    consolidated_props = pd.DataFrame.from_records(props_list)
+
+    datetime_keys = set()
+    categorical_keys = {"Procedure type"}
+    for procedure in consolidated_props["Procedure type"].unique():
+        datetime_keys |= get_datetime_keys(procedure)
+        categorical_keys |= get_categorical_keys(procedure)
+
+    # Unix timestamps are converted to datetimes in a single call per column
+    for key in datetime_keys.intersection(consolidated_props.columns):
+        consolidated_props[key] = pd.to_datetime(consolidated_props[key], unit='s')
+
+    # Low-cardinality string columns are stored as categories
+    for key in categorical_keys.intersection(consolidated_props.columns):
+        consolidated_props[key] = consolidated_props[key].astype("category")
 
     # we sort by date and reset the index
     consolidated_props.sort_values(by="Start time", inplace=True)
     consolidated_props.reset_index(drop=True, inplace=True)
+    return consolidated_props
+
+
+def separate_nanolab_project(
+    experiments: Dict[str, Callable], max_workers: Optional[int] = None
+) -> Iterator[Tuple[Dict[str, pd.DataFrame], List[Dict]]]:
+    """
+    Separates the experiments of a NanoLab project into data partitions and properties.
+
+    Node of the 'base_processing' pipeline. Experiments are parsed by `iter_nanolab_dataset`
+    and yielded in batches, as (data partitions of the batch, properties of every experiment
+    processed so far), so Kedro saves the partitions of each batch as it is parsed and only a
+    few batches of experiments are held in memory. The properties are consolidated once every
+    partition is saved, see `consolidate_props`.
+
+    Experiments that fail to parse are logged and left out of both outputs.
+    """
+    logger.info("Starting separation of NanoLab project with %d experiments.", len(experiments))
+    batch_size = _window(max_workers)
+    results = iter_nanolab_dataset(experiments, max_workers=max_workers)
+    props_list = []
+    while True:
+        batch = list(islice(results, batch_size))
+        if not batch:
+            break
+        props_list.extend(prop for _, prop, _ in batch)
+        yield {key: data for key, _, data in batch}, props_list
+
+    if not props_list:
+        logger.warning("No experiment of the project could be processed.")
+        # Kedro expects a generator node to yield at least once
+        yield {}, props_list
 
-    logger.info("Finished dataset separation.")
-    return consolidated_props, indexed_data
+    logger.info("Finished project separation.")
@@ -0,0 +1,10 @@
+"""
+Pipeline 'base_processing', which separates every NanoLab project into
+its properties and data partitions.
+"""
+
+from .pipeline import create_pipeline
+
+__all__ = ["create_pipeline"]
+
+__version__ = "0.1"
@@ -0,0 +1,75 @@
+"""
+Pipeline 'base_processing'.
+
+For every ``project_*`` dataset of the catalog, a node separates the raw
+experiments into ``data_<project>``, written batch by batch as the
+experiments are parsed, and a second node builds ``properties_<project>``
+once every partition is saved. These datasets are registered by
+`DynamicDatasetHook`.
+"""
+import logging
+from pathlib import Path
+from typing import Any
+
+from kedro.framework.project import settings
+from kedro.pipeline import Pipeline, node, pipeline
+
+from nanolab_processing_base.hooks import DynamicDatasetHook
+from nanolab_processing_base.hooks_utils import (
+    consolidate_props,
+    separate_nanolab_project,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _context_config_loader() -> Any:
+    # Stored by `DynamicDatasetHook` once Kedro creates the context, before it
+    # resolves the pipeline to run
+    for hook in settings.HOOKS:
+        if isinstance(hook, DynamicDatasetHook):
+            return hook.config_loader
+    return None
+
+
+def get_project_names(config_loader: Any = None) -> list[str]:
+    """
+    Lists the ``project_*`` datasets declared in the catalog configuration.
+
+    The configuration is read through ``config_loader``, by default the config loader
+    of the current Kedro context, so ``--env`` and ``--conf-source`` are honoured.
+    Commands that list pipelines without creating a context fall back to the
+    configuration source of the current directory with the default environments.
+    Projects declared only through dataset factory patterns are not listed.
+    """
+    if config_loader is None:
+        config_loader = _context_config_loader()
+    if config_loader is None:
+        config_loader = settings.CONFIG_LOADER_CLASS(
+            conf_source=str(Path.cwd() / settings.CONF_SOURCE), **settings.CONFIG_LOADER_ARGS
+        )
+
+    project_names = [name for name in config_loader["catalog"] if name.startswith("project_")]
+    if not project_names:
+        logger.warning("No 'project_*' datasets found in the catalog; 'base_processing' is empty.")
+    return project_names
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    nodes = []
+    for project in get_project_names(kwargs.get("config_loader")):
+        nodes += [
+            node(
+                func=separate_nanolab_project,
+                inputs=[project, "params:max_workers"],
+                outputs=[f"data_{project}", f"props_list_{project}"],
+                name=f"separate_{project}",
+            ),
+            node(
+                func=consolidate_props,
+                inputs=f"props_list_{project}",
+                outputs=f"properties_{project}",
+                name=f"consolidate_{project}",
+            ),
+        ]
+    return pipeline(nodes)
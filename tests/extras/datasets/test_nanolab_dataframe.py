@@ -0,0 +1,93 @@
+"""
+Tests for the NanoLab file parsing helpers.
+"""
+import os
+
+import pytest
+from nanolab_processing_base.extras.datasets.nanolab_dataframe import (
+    _read_data,
+    get_data_key,
+    parse_metadata,
+    read_comment_lines,
+    scan_prefix,
+)
+
+DTYPES = {"Vg (V)": "float", "I (A)": "float"}
+
+HEADER = b"#\tProcedure: <laser.IVg>\n#\tVDS: 0.1 V\n#Data:\n"
+BODY = b"Vg (V),I (A)\n1,2\n# not a comment\n"
+
+
+def test_scan_prefix(tmp_path):
+    path = tmp_path / "file.csv"
+    path.write_bytes(HEADER + BODY)
+
+    first_line, comment_lines, header_count, byte_offset = scan_prefix(str(path))
+
+    assert first_line == b"#\tProcedure: <laser.IVg>\n"
+    assert comment_lines == ["Procedure: <laser.IVg>", "VDS: 0.1 V"]
+    assert header_count == HEADER.count(b"\n")
+    assert path.read_bytes()[byte_offset:].startswith(b"Vg (V),I (A)\n")
+
+
+def test_scan_prefix_stops_at_first_non_comment_line(tmp_path):
+    path = tmp_path / "file.csv"
+    path.write_bytes(b" #\tVDS: 0.1 V\n" + HEADER + BODY)
+
+    _, comment_lines, header_count, byte_offset = scan_prefix(str(path))
+
+    assert (comment_lines, header_count, byte_offset) == ([], 0, 0)
+
+
+def test_read_comment_lines_without_tab_comments(tmp_path):
+    path = tmp_path / "file.csv"
+    path.write_bytes(b"#Data:\n" + BODY)
+
+    assert read_comment_lines(str(path)) == ({}, 0)
+
+
+def test_read_data_keeps_file_column_order():
+    data = _read_data(b"I (A),Vg (V),T (degC)\n1,2,3\n", 0, DTYPES, "file.csv")
+
+    assert list(data.columns) == ["I (A)", "Vg (V)"]
+
+
+def test_read_data_skips_missing_columns():
+    data = _read_data(b"I (A)\n1\n", 0, DTYPES, "file.csv")
+
+    assert list(data.columns) == ["I (A)"]
+
+
+@pytest.mark.parametrize(
+    "value, how_to_process, expected",
+    [
+        ("0.1 V", "float", 0.1),
+        ("530.0 nm", "float", 530.0),
+        ("1e-3", "float_no_unit", 1e-3),
+        ("2", "int", 2),
+        ("True", "bool", True),
+        ("False", "bool", False),
+        ("Sample1", "str", "Sample1"),
+        ("Margarita", "categorical", "Margarita"),
+        ("1731364225.4285064", "datetime", 1731364225.4285064),
+    ],
+)
+def test_parse_metadata(value, how_to_process, expected):
+    assert parse_metadata("key", value, how_to_process) == expected
+
+
+def test_parse_metadata_unknown_type():
+    with pytest.raises(ValueError, match="Unhandled metadata key: key"):
+        parse_metadata("key", "1", "complex")
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("data/01_raw/project/2024-11-29/ITt2024-11-29_1.csv", "2024-11-29/ITt2024-11-29_1"),
+        # Only the last extension is stripped
+        ("data/01_raw/project/2024-11-29/ITt_1.v2.csv", "2024-11-29/ITt_1.v2"),
+    ],
+)
+def test_get_data_key(path, expected):
+    assert get_data_key(os.path.normpath(path)) == os.path.normpath(expected)
@@ -0,0 +1,24 @@
+"""
+Tests for the C implementation of the comment prefix scan.
+"""
+import io
+
+import pytest
+from nanolab_processing_base.extras.datasets.nanolab_dataframe import _scan_prefix_lines
+
+_prefix = pytest.importorskip("nanolab_processing_base.extras._prefix")
+
+FILES = {
+    "lf": b"#\tProcedure: <laser.IVg>\n#\tParameters:\n#\tVDS: 0.1 V\n# Data:\nVg (V),I (A)\n1,2\n",
+    "crlf": b"#\tProcedure: <laser.IVg>\r\n#\tVDS: 0.1 V\r\n#Data:\r\nVg (V),I (A)\r\n1,2\r\n",
+    "no_tab": b"#\tProcedure: <laser.IVg>\n#Data:\n#\tVDS: 0.1 V\nVg (V),I (A)\n",
+    "no_data_rows": b"#\tProcedure: <laser.IVg>\n#\tVDS: 0.1 V\n",
+    "information": b"#\tProcedure: <laser.IVg>\n#\tInformation: chip 1 (dark)\n#\tVDS: 0.1 V\nVg (V),I (A)\n1,2\n",
+    "no_comments": b"Vg (V),I (A)\n1,2\n",
+    "empty": b"",
+}
+
+
+@pytest.mark.parametrize("content", FILES.values(), ids=FILES.keys())
+def test_scan_prefix_buffer_matches_python_scan(content):
+    assert _prefix.scan_prefix_buffer(content) == _scan_prefix_lines(io.BytesIO(content))
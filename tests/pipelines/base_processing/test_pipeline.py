@@ -1,9 +1,41 @@
 """
-This is a boilerplate test file for pipeline 'base_processing'
-generated using Kedro 0.19.10.
-Please add your pipeline tests here.
-
-Kedro recommends using `pytest` framework, more info about it can be found
-in the official documentation:
-https://docs.pytest.org/en/latest/getting-started.html
+Tests for pipeline 'base_processing'.
 """
+import pytest
+from nanolab_processing_base.pipelines.base_processing import create_pipeline
+
+PROJECT = {
+    "type": "partitions.PartitionedDataset",
+    "path": "data/01_raw/project",
+    "dataset": "nanolab_processing_base.extras.datasets.nanolab_dataset.NanoLabDataSet",
+    "filename_suffix": ".csv",
+}
+
+
+@pytest.fixture
+def config_loader():
+    return {"catalog": {"project_UV": PROJECT, "project_IR": PROJECT, "reference_table": {}}}
+
+
+def test_nodes_per_project(config_loader):
+    nodes = create_pipeline(config_loader=config_loader).nodes
+
+    assert sorted(node.name for node in nodes) == [
+        "consolidate_project_IR",
+        "consolidate_project_UV",
+        "separate_project_IR",
+        "separate_project_UV",
+    ]
+
+
+def test_node_inputs_and_outputs(config_loader):
+    nodes = {node.name: node for node in create_pipeline(config_loader=config_loader).nodes}
+
+    assert nodes["separate_project_UV"].inputs == ["project_UV", "params:max_workers"]
+    assert nodes["separate_project_UV"].outputs == ["data_project_UV", "props_list_project_UV"]
+    assert nodes["consolidate_project_UV"].inputs == ["props_list_project_UV"]
+    assert nodes["consolidate_project_UV"].outputs == ["properties_project_UV"]
+
+
+def test_empty_without_projects():
+    assert create_pipeline(config_loader={"catalog": {}}).nodes == []
@@ -0,0 +1,131 @@
+"""
+Tests for the helpers of the 'base_processing' pipeline.
+"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+from nanolab_processing_base.extras.datasets.nanolab_dataframe import (
+    make_props_data,
+    set_procedures,
+)
+from nanolab_processing_base.hooks_utils import consolidate_props, iter_nanolab_dataset
+
+ITT_FILE = b"""#Procedure: <laser_setup.procedures.ITt>
+#Parameters:
+#\tIrange: 0.001
+#\tNPLC: 1
+#\tN_avg: 2
+#\tChained execution: False
+#\tChip group name: Margarita
+#\tChip number: 68
+#\tInformation:
+#\tLaser ON+OFF period: 120.0 s
+#\tLaser voltage: 3.5 V
+#\tLaser wavelength: 530.0 nm
+#\tProcedure version: 1.0.0
+#\tSample: Sample1
+#\tSampling time (excluding Keithley): 0.0 s
+#\tShow more: False
+#\tVDS: 0.1 V
+#\tVG: 0.0 V
+#Metadata:
+#\tStart time: 1731364225.4285064
+#Data:
+t (s),I (A),VL (V),Plate T (degC),Ambient T (degC),Clock (ms)
+0.0,1e-06,0.0,25.0,24.0,0
+0.5,2e-06,3.5,25.1,24.0,500
+"""
+
+
+@pytest.fixture
+def procedures():
+    with open(Path.cwd() / "conf" / "base" / "parameters.yml") as file:
+        procedures = yaml.safe_load(file)["procedures"]
+    set_procedures(procedures)
+    yield procedures
+    set_procedures(None)
+
+
+def _experiment(key, calls):
+    def load():
+        calls.append(key)
+        if key == "bad":
+            raise ValueError("malformed data block")
+        return {"data_key": key}, pd.DataFrame({"t (s)": [0.0]})
+
+    return load
+
+
+def test_iter_nanolab_dataset_keeps_order_and_skips_failures():
+    calls = []
+    experiments = {key: _experiment(key, calls) for key in ["a", "bad", "b", "c"]}
+
+    keys = [key for key, _, _ in iter_nanolab_dataset(experiments, max_workers=2)]
+
+    assert keys == ["a", "b", "c"]
+    assert sorted(calls) == ["a", "b", "bad", "c"]
+
+
+def test_iter_nanolab_dataset_parses_a_bounded_window_ahead():
+    calls = []
+    experiments = {f"exp_{i}": _experiment(f"exp_{i}", calls) for i in range(20)}
+
+    max_workers = 1
+    results = iter_nanolab_dataset(experiments, max_workers=max_workers)
+    next(results)
+
+    # Two experiments per worker, plus the one submitted when the first is consumed
+    assert len(calls) <= 2 * max_workers + 1
+    results.close()
+
+
+def test_make_props_data(procedures, tmp_path):
+    path = tmp_path / "2024-11-29" / "ITt2024-11-29_1.csv"
+    path.parent.mkdir()
+    path.write_bytes(ITT_FILE)
+
+    props, data = make_props_data(str(path))
+
+    assert props["Procedure type"] == "ITt"
+    assert props["data_key"] == "2024-11-29/ITt2024-11-29_1"
+    assert props["Start time"] == pytest.approx(1731364225.4285064)
+    assert props["VDS"] == pytest.approx(0.1)
+    assert props["Chip group name"] == "Margarita"
+    assert props["Chained execution"] is False
+    assert list(data.columns) == list(procedures["ITt"]["Data"])
+    assert data["I (A)"].tolist() == [1e-06, 2e-06]
+
+
+def test_consolidate_props_converts_datetimes(procedures):
+    props = consolidate_props([
+        {"Procedure type": "ITt", "Start time": 1731364225.5},
+        {"Procedure type": "ITt", "Start time": 1731364100.0},
+    ])
+
+    assert props["Start time"].dtype == "datetime64[ns]"
+    assert props["Start time"].tolist() == [
+        pd.Timestamp(1731364100.0, unit="s"),
+        pd.Timestamp(1731364225.5, unit="s"),
+    ]
+
+
+def test_consolidate_props_without_experiments():
+    assert consolidate_props([]).empty
+
+
+def test_consolidate_props_categories_and_order_with_mixed_procedures(procedures):
+    props = consolidate_props([
+        {"Procedure type": "IVg", "Start time": 30.0, "Chip group name": "Margarita", "VG end": 1.0},
+        {"Procedure type": "ITt", "Start time": 10.0, "Chip group name": "Margarita", "VG": 0.0},
+        {"Procedure type": "It", "Start time": 20.0, "Chip group name": "Alisson"},
+    ])
+
+    assert props["Procedure type"].tolist() == ["ITt", "It", "IVg"]
+    assert isinstance(props["Procedure type"].dtype, pd.CategoricalDtype)
+    assert isinstance(props["Chip group name"].dtype, pd.CategoricalDtype)
+    assert props["Chip group name"].cat.categories.tolist() == ["Alisson", "Margarita"]
+    assert props["Start time"].dtype == "datetime64[ns]"
+    assert props["VG end"].isna().tolist() == [True, True, False]
+    assert props.index.tolist() == [0, 1, 2]